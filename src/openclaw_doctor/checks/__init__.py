@@ -1,34 +1,97 @@
 """Health checks package."""
 
+import functools
+import importlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Sequence
+
 from .base import BaseCheck, CheckResult, CheckStatus
-from .nodejs import NodeJSCheck
-from .openclaw import OpenClawCheck
-from .docker import DockerCheck
-from .system import SystemCheck
-from .folders import FoldersCheck
-from .config import ConfigCheck
-from .api_keys import APIKeysCheck
-from .network import NetworkCheck
-from .logs import LogsCheck
-
-# All available checks in order
-ALL_CHECKS: list[type[BaseCheck]] = [
-    NodeJSCheck,
-    OpenClawCheck,
-    DockerCheck,
-    SystemCheck,
-    FoldersCheck,
-    ConfigCheck,
-    APIKeysCheck,
-    NetworkCheck,
-    LogsCheck,
-]
+
+# All available checks in order, by short name. Check modules are only
+# imported when first requested, so running a single check doesn't pay
+# for the dependencies of the others (psutil, httpx, ...).
+_REGISTRY: dict[str, tuple[str, str]] = {
+    "nodejs": (".nodejs", "NodeJSCheck"),
+    "openclaw": (".openclaw", "OpenClawCheck"),
+    "docker": (".docker", "DockerCheck"),
+    "system": (".system", "SystemCheck"),
+    "folders": (".folders", "FoldersCheck"),
+    "config": (".config", "ConfigCheck"),
+    "api_keys": (".api_keys", "APIKeysCheck"),
+    "network": (".network", "NetworkCheck"),
+    "logs": (".logs", "LogsCheck"),
+}
+
+CHECK_NAMES: tuple[str, ...] = tuple(_REGISTRY)
+
+_CLASS_TO_NAME = {class_name: name for name, (_, class_name) in _REGISTRY.items()}
+
+
+@functools.cache
+def get_check_class(name: str) -> type[BaseCheck]:
+    """Import and return the check class registered under a short name."""
+    module_name, class_name = _REGISTRY[name]
+    return getattr(importlib.import_module(module_name, __name__), class_name)
+
+
+def get_check(name: str) -> BaseCheck:
+    """Create the check registered under a short name."""
+    return get_check_class(name)()
+
+
+@functools.cache
+def all_checks() -> tuple[type[BaseCheck], ...]:
+    """Import and return every check class in order."""
+    return tuple(get_check_class(name) for name in CHECK_NAMES)
+
+
+def run_all(
+    checks: Sequence[BaseCheck] | None = None,
+    on_result: Callable[[CheckResult], None] | None = None,
+) -> list[CheckResult]:
+    """Run checks concurrently and return their results in order.
+    
+    Checks spend their time waiting on subprocesses, the filesystem and the
+    network, so running them on threads cuts wall time to the slowest check.
+    If given, on_result is called on the calling thread as each check
+    finishes, in completion order.
+    """
+    if checks is None:
+        checks = [check_class() for check_class in all_checks()]
+    if not checks:
+        return []
+    
+    results: list[CheckResult | None] = [None] * len(checks)
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {executor.submit(check.run): i for i, check in enumerate(checks)}
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_result:
+                on_result(result)
+    
+    return results
+
+
+def __getattr__(name: str):
+    # ALL_CHECKS and the check classes resolve lazily on first access
+    if name == "ALL_CHECKS":
+        return all_checks()
+    if name in _CLASS_TO_NAME:
+        return get_check_class(_CLASS_TO_NAME[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseCheck",
     "CheckResult",
     "CheckStatus",
     "ALL_CHECKS",
+    "CHECK_NAMES",
+    "all_checks",
+    "get_check",
+    "get_check_class",
+    "run_all",
     "NodeJSCheck",
     "OpenClawCheck",
     "DockerCheck",
@@ -39,5 +102,3 @@ __all__ = [
     "NetworkCheck",
     "LogsCheck",
 ]
-
-
@@ -0,0 +1,26 @@
+"""Helpers for probing candidate files."""
+
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+def iter_open(paths: Iterable[Path]) -> Iterator[tuple[int, Path]]:
+    """Yield a read-only fd for each candidate path that can be opened.
+
+    Opening directly replaces an exists() + open() pair with a single
+    syscall. The caller owns each yielded fd and must close it.
+    """
+    for path in paths:
+        try:
+            fd = os.open(path, _OPEN_FLAGS)
+        except OSError:
+            continue
+        yield fd, path
+
+
+def open_first(paths: Iterable[Path]) -> tuple[int | None, Path | None]:
+    """Open the first candidate path that exists."""
+    return next(iter_open(paths), (None, None))
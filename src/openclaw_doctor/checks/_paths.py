@@ -0,0 +1,58 @@
+"""OpenClaw home directory resolution shared by the checks."""
+
+import functools
+import os
+import sys
+from pathlib import Path
+
+# The user's home directory, computed once per process
+HOME = os.path.expanduser("~")
+
+
+@functools.lru_cache(maxsize=8)
+def _candidate_homes(
+    home: str,
+    openclaw_home: str | None,
+    xdg_config_home: str | None,
+) -> tuple[str, ...]:
+    homes = [openclaw_home] if openclaw_home else []
+    homes.append(os.path.join(home, ".openclaw"))
+    # Per the XDG spec, a relative XDG_CONFIG_HOME is ignored
+    if xdg_config_home and os.path.isabs(xdg_config_home):
+        homes.append(os.path.join(xdg_config_home, "openclaw"))
+    else:
+        homes.append(os.path.join(home, ".config", "openclaw"))
+    if sys.platform == "win32":
+        homes.append(os.path.join(home, "AppData", "Local", "openclaw"))
+    return tuple(homes)
+
+
+def candidate_homes() -> tuple[str, ...]:
+    """Possible OpenClaw home directories, most preferred first.
+    
+    $OPENCLAW_HOME when set, then ~/.openclaw, then openclaw under
+    $XDG_CONFIG_HOME (default ~/.config), then AppData/Local on Windows.
+    """
+    return _candidate_homes(
+        HOME,
+        os.environ.get("OPENCLAW_HOME"),
+        os.environ.get("XDG_CONFIG_HOME"),
+    )
+
+
+def find_home() -> str | None:
+    """Return the first candidate home that exists as a directory."""
+    for path in candidate_homes():
+        if os.path.isdir(path):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=16)
+def _candidate_files(homes: tuple[str, ...], names: tuple[str, ...]) -> tuple[Path, ...]:
+    return tuple(Path(home, name) for home in homes for name in names)
+
+
+def candidate_files(*names: str) -> tuple[Path, ...]:
+    """Every name joined to every candidate home, in preference order."""
+    return _candidate_files(candidate_homes(), names)
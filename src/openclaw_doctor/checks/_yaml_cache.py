@@ -0,0 +1,31 @@
+"""Shared YAML loader cached on file identity."""
+
+import functools
+import os
+from pathlib import Path
+from typing import Any
+
+
+@functools.cache
+def _yaml_loader() -> type:
+    """Return the libyaml-backed loader when PyYAML was built with it."""
+    # Imported lazily so checks that never read YAML don't pay for PyYAML
+    import yaml
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file. Cached on (path, mtime, size) so edits invalidate it."""
+    import yaml
+    return yaml.load(Path(path_str).read_text(encoding="utf-8"), Loader=_yaml_loader())
+
+
+def load_yaml(path: Path, fd: int | None = None) -> Any:
+    """Load a YAML file, reusing the parsed result if the file is unchanged.
+    
+    If the caller already holds an open fd for the file it is used for the
+    stat instead of resolving the path again.
+    """
+    st = os.fstat(fd) if fd is not None else os.stat(path)
+    return _load_yaml_cached(str(path), st.st_mtime_ns, st.st_size)
@@ -2,13 +2,45 @@
 
 import os
 import re
+import string
 import sys
 from pathlib import Path
 
-import yaml
-
+from ._files import iter_open
+from ._paths import candidate_files
+from ._yaml_cache import load_yaml
 from .base import BaseCheck, CheckResult, CheckStatus
 
+_ALNUM = frozenset(string.ascii_letters + string.digits)
+_ALNUM_DASH_UNDER = _ALNUM | {"-", "_"}
+
+# KEY=value assignments in a .env file; comments never match
+_ENV_LINE_RE = re.compile(rb"(?m)^[ \t]*([A-Z_][A-Z0-9_]*)[ \t]*=")
+
+# (prefix, prefix length, min body length, max body length, allowed body characters)
+_Validator = tuple[str, int, int, int, frozenset[str]]
+
+
+def _build_validators(
+    env_keys: list[str],
+    key_specs: dict[str, tuple[str, int, frozenset[str], bool]],
+) -> dict[str, _Validator | None]:
+    """Flatten KEY_SPECS into a validator (or None) for every known variable."""
+    validators: dict[str, _Validator | None] = {}
+    for key_name in env_keys:
+        spec = key_specs.get(key_name)
+        if spec is None:
+            validators[key_name] = None
+            continue
+        prefix, length, charset, exact = spec
+        validators[key_name] = (prefix, len(prefix), length, length if exact else sys.maxsize, charset)
+    return validators
+
+
+# File names looked for in each candidate OpenClaw home
+_ENV_FILE_NAMES = (".env", "env")
+_CONFIG_NAMES = ("config.yaml", "config.yml")
+
 
 class APIKeysCheck(BaseCheck):
     """Check if API keys are configured for AI providers."""
@@ -16,12 +48,13 @@ class APIKeysCheck(BaseCheck):
     name = "API Keys"
     description = "Checks AI provider keys configured"
     
-    # Known API key patterns (for basic validation, not security)
-    KEY_PATTERNS = {
-        "ANTHROPIC_API_KEY": r"^sk-ant-[a-zA-Z0-9\-_]{40,}$",
-        "OPENAI_API_KEY": r"^sk-[a-zA-Z0-9]{40,}$",
-        "GOOGLE_API_KEY": r"^AIza[a-zA-Z0-9\-_]{35}$",
-        "GROQ_API_KEY": r"^gsk_[a-zA-Z0-9]{50,}$",
+    # Known API key formats (for basic validation, not security):
+    # (prefix, body length, allowed body characters, exact length)
+    KEY_SPECS = {
+        "ANTHROPIC_API_KEY": ("sk-ant-", 40, _ALNUM_DASH_UNDER, False),
+        "OPENAI_API_KEY": ("sk-", 40, _ALNUM, False),
+        "GOOGLE_API_KEY": ("AIza", 35, _ALNUM_DASH_UNDER, True),
+        "GROQ_API_KEY": ("gsk_", 50, _ALNUM, False),
     }
     
     # Environment variables to check
@@ -33,6 +66,16 @@ class APIKeysCheck(BaseCheck):
         "GROQ_API_KEY",
         "OPENROUTER_API_KEY",
     ]
+    _ENV_KEYS_SET = frozenset(ENV_KEYS)
+    _VALIDATORS = _build_validators(ENV_KEYS, KEY_SPECS)
+    
+    __slots__ = (
+        "_found_keys",
+        "_invalid_keys",
+        "_config_keys",
+        "_env_file_keys",
+        "_env_file_path",
+    )
     
     def __init__(self):
         self._found_keys: list[str] = []
@@ -46,83 +89,70 @@ class APIKeysCheck(BaseCheck):
         found = []
         invalid = []
         
-        for key_name in self.ENV_KEYS:
-            value = os.environ.get(key_name)
-            if value:
-                # Basic validation
-                pattern = self.KEY_PATTERNS.get(key_name)
-                if pattern and not re.match(pattern, value):
+        # One pass over the environment instead of a lookup per known key
+        validators = self._VALIDATORS
+        for key_name, value in os.environ.items():
+            if not value or key_name not in validators:
+                continue
+            # Basic validation
+            validator = validators[key_name]
+            if validator is not None:
+                prefix, prefix_len, min_len, max_len, charset = validator
+                if not (
+                    value.startswith(prefix)
+                    and min_len <= len(value) - prefix_len <= max_len
+                    and charset.issuperset(value[prefix_len:])
+                ):
                     invalid.append(key_name)
-                else:
-                    found.append(key_name)
+                    continue
+            found.append(key_name)
         
         return found, invalid
     
     def _check_env_file(self) -> tuple[list[str], Path | None]:
         """Check for API keys in OpenClaw .env file."""
-        home = Path.home()
-        env_paths = [
-            home / ".openclaw" / ".env",
-            home / ".openclaw" / "env",
-            home / ".config" / "openclaw" / ".env",
-            Path.cwd() / ".env",  # Also check current directory
-        ]
-        
-        if sys.platform == "win32":
-            env_paths.append(home / "AppData" / "Local" / "openclaw" / ".env")
-        
-        for env_path in env_paths:
-            if env_path.exists():
-                try:
-                    found = []
-                    with open(env_path, encoding="utf-8") as f:
-                        for line in f:
-                            line = line.strip()
-                            # Skip comments and empty lines
-                            if not line or line.startswith("#"):
-                                continue
-                            # Parse KEY=value format
-                            if "=" in line:
-                                key = line.split("=", 1)[0].strip()
-                                if key in self.ENV_KEYS:
-                                    found.append(f"{key} (in .env)")
-                    if found:
-                        return found, env_path
-                except Exception:
-                    pass
+        # Also check current directory, which may change between runs
+        env_paths = (*candidate_files(*_ENV_FILE_NAMES), Path.cwd() / ".env")
+        
+        for fd, env_path in iter_open(env_paths):
+            try:
+                # .env files are tiny, so one read beats line-buffered IO
+                data = os.read(fd, 65536)
+            except OSError:
+                continue
+            finally:
+                os.close(fd)
+            
+            found = []
+            for match in _ENV_LINE_RE.finditer(data):
+                key = match.group(1).decode("ascii")
+                if key in self._ENV_KEYS_SET:
+                    found.append(f"{key} (in .env)")
+            if found:
+                return found, env_path
         
         return [], None
     
     def _check_config_keys(self) -> list[str]:
         """Check for API keys in OpenClaw config."""
-        home = Path.home()
-        config_paths = [
-            home / ".openclaw" / "config.yaml",
-            home / ".openclaw" / "config.yml",
-            home / ".config" / "openclaw" / "config.yaml",
-        ]
-        
-        if sys.platform == "win32":
-            config_paths.append(home / "AppData" / "Local" / "openclaw" / "config.yaml")
-        
-        for config_path in config_paths:
-            if config_path.exists():
-                try:
-                    with open(config_path, encoding="utf-8") as f:
-                        config = yaml.safe_load(f)
-                    
-                    if config:
-                        found = []
-                        # Check for api_key or provider-specific keys
-                        if config.get("api_key"):
-                            found.append("api_key (in config)")
-                        if config.get("anthropic", {}).get("api_key"):
-                            found.append("anthropic.api_key")
-                        if config.get("openai", {}).get("api_key"):
-                            found.append("openai.api_key")
-                        return found
-                except Exception:
-                    pass
+        for fd, config_path in iter_open(candidate_files(*_CONFIG_NAMES)):
+            try:
+                config = load_yaml(config_path, fd)
+                
+                if config:
+                    found = []
+                    # Check for api_key or provider-specific keys
+                    if config.get("api_key"):
+                        found.append("api_key (in config)")
+                    if config.get("anthropic", {}).get("api_key"):
+                        found.append("anthropic.api_key")
+                    if config.get("openai", {}).get("api_key"):
+                        found.append("openai.api_key")
+                    return found
+            except Exception:
+                pass
+            finally:
+                os.close(fd)
         
         return []
     
@@ -14,7 +14,7 @@ class CheckStatus(Enum):
     SKIP = "skip"
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     """Result of a health check."""
     name: str
@@ -23,6 +23,10 @@ class CheckResult:
     details: str | None = None
     can_auto_fix: bool = False
     fix_suggestions: list[str] = field(default_factory=list)
+    _status_str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._status_str = self.status.value
     
     @property
     def passed(self) -> bool:
@@ -38,7 +42,7 @@ class CheckResult:
         """Convert to dictionary for JSON output."""
         return {
             "name": self.name,
-            "status": self.status.value,
+            "status": self._status_str,
             "message": self.message,
             "details": self.details,
             "can_auto_fix": self.can_auto_fix,
@@ -49,6 +53,8 @@ class CheckResult:
 class BaseCheck(ABC):
     """Base class for all health checks."""
     
+    __slots__ = ()
+    
     name: str = "Base Check"
     description: str = "A health check"
     
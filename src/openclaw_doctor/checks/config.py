@@ -1,13 +1,16 @@
 """OpenClaw configuration check."""
 
-import json
-import sys
+import os
 from pathlib import Path
 
-import yaml
-
+from ._files import open_first
+from ._paths import candidate_files, candidate_homes
+from ._yaml_cache import load_yaml
 from .base import BaseCheck, CheckResult, CheckStatus
 
+# Config file names, in order of preference within each home
+_CONFIG_NAMES = ("config.yaml", "config.yml", "config.json")
+
 
 class ConfigCheck(BaseCheck):
     """Check OpenClaw configuration files."""
@@ -19,49 +22,44 @@ class ConfigCheck(BaseCheck):
     REQUIRED_FIELDS = ["provider"]
     OPTIONAL_FIELDS = ["model", "channels", "skills"]
     
+    __slots__ = ("_config_path", "_config", "_missing_fields")
+    
     def __init__(self):
         self._config_path: Path | None = None
         self._config: dict | None = None
         self._missing_fields: list[str] = []
     
-    def _find_config(self) -> Path | None:
-        """Find the OpenClaw config file."""
-        home = Path.home()
-        
-        possible_paths = [
-            home / ".openclaw" / "config.yaml",
-            home / ".openclaw" / "config.yml",
-            home / ".openclaw" / "config.json",
-            home / ".config" / "openclaw" / "config.yaml",
-            home / ".config" / "openclaw" / "config.yml",
-            home / ".config" / "openclaw" / "config.json",
-        ]
-        
-        if sys.platform == "win32":
-            possible_paths.extend([
-                home / "AppData" / "Local" / "openclaw" / "config.yaml",
-                home / "AppData" / "Local" / "openclaw" / "config.json",
-            ])
-        
-        for path in possible_paths:
-            if path.exists():
-                return path
-        
-        return None
+    def _find_config(self) -> tuple[int | None, Path | None]:
+        """Find and open the OpenClaw config file."""
+        return open_first(candidate_files(*_CONFIG_NAMES))
     
-    def _parse_config(self, path: Path) -> dict | None:
-        """Parse the config file."""
+    def _parse_config(self, path: Path, fd: int) -> dict | None:
+        """Parse the config file from the fd opened by _find_config."""
         try:
-            content = path.read_text(encoding="utf-8")
-            
             if path.suffix == ".json":
-                return json.loads(content)
-            else:  # YAML
-                return yaml.safe_load(content)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON: {e}")
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML: {e}")
+                import json
+                
+                try:
+                    # orjson is an optional speedup; both accept raw UTF-8 bytes
+                    from orjson import loads as json_loads
+                except ImportError:
+                    json_loads = json.loads
+                
+                with open(fd, "rb", closefd=False) as f:
+                    try:
+                        return json_loads(f.read())
+                    except json.JSONDecodeError as e:
+                        raise ValueError(f"Invalid JSON: {e}")
+            
+            # YAML, shared with the API keys check; PyYAML is only imported here
+            import yaml
+            
+            try:
+                return load_yaml(path, fd)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML: {e}")
+        finally:
+            os.close(fd)
     
     def _validate_config(self, config: dict) -> list[str]:
         """Validate config and return list of missing required fields."""
@@ -73,7 +71,7 @@ class ConfigCheck(BaseCheck):
     
     def run(self) -> CheckResult:
         """Run the config check."""
-        self._config_path = self._find_config()
+        config_fd, self._config_path = self._find_config()
         
         if not self._config_path:
             return CheckResult(
@@ -89,7 +87,7 @@ class ConfigCheck(BaseCheck):
             )
         
         try:
-            self._config = self._parse_config(self._config_path)
+            self._config = self._parse_config(self._config_path, config_fd)
         except ValueError as e:
             return CheckResult(
                 name=self.name,
@@ -135,12 +133,13 @@ class ConfigCheck(BaseCheck):
     
     def fix(self) -> bool:
         """Attempt to fix config issues."""
+        import yaml
+        
         from ..console import console, print_fix_action, print_suggestion
         
         if not self._config_path:
             # Create default config directory
-            home = Path.home()
-            config_dir = home / ".openclaw"
+            config_dir = Path(candidate_homes()[0])
             config_path = config_dir / "config.yaml"
             
             print_fix_action("Creating default OpenClaw config...")
@@ -1,11 +1,45 @@
 """Docker and Docker Compose check."""
 
+import functools
+import json
 import shutil
 import subprocess
 import sys
 
 from .base import BaseCheck, CheckResult, CheckStatus
 
+# docker and docker-compose are looked up several times per run
+_which = functools.cache(shutil.which)
+
+
+@functools.lru_cache(maxsize=None)
+def _docker_info_json() -> tuple[dict, bool] | None:
+    """Get client, server and plugin info from a single `docker info` call.
+    
+    Returns the parsed info and whether the daemon is running, or None if
+    the output could not be parsed.
+    """
+    try:
+        result = subprocess.run(
+            ["docker", "info", "--format", "{{json .}}"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    
+    # The client still prints its own info when the daemon is down
+    try:
+        info = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(info, dict):
+        return None
+    
+    running = result.returncode == 0 and not info.get("ServerErrors")
+    return info, running
+
 
 class DockerCheck(BaseCheck):
     """Check if Docker and Docker Compose are installed and running."""
@@ -13,17 +47,30 @@ class DockerCheck(BaseCheck):
     name = "Docker"
     description = "Validates Docker & Compose setup (optional)"
     
+    __slots__ = ("_docker_version", "_compose_version", "_docker_running", "_docker_info")
+    
     def __init__(self):
         self._docker_version: str | None = None
         self._compose_version: str | None = None
         self._docker_running: bool = False
+        self._docker_info: dict | None = None
     
     def _check_docker(self) -> tuple[str | None, bool]:
         """Check Docker installation and status."""
-        docker_path = shutil.which("docker")
+        self._docker_info = None
+        docker_path = _which("docker")
         if not docker_path:
             return None, False
         
+        docker_info = _docker_info_json()
+        if docker_info:
+            info, running = docker_info
+            version = (info.get("ClientInfo") or {}).get("Version") or info.get("ServerVersion")
+            if version:
+                self._docker_info = info
+                return version, running
+        
+        # Older Docker without JSON info output: probe separately
         # Get version
         try:
             result = subprocess.run(
@@ -40,16 +87,16 @@ class DockerCheck(BaseCheck):
         except (subprocess.TimeoutExpired, FileNotFoundError):
             version = None
         
-        # Check if daemon is running
+        # Check if daemon is running; only the exit code matters, so skip
+        # the pipes (which also lets subprocess use posix_spawn)
         running = False
         try:
-            result = subprocess.run(
+            running = subprocess.call(
                 ["docker", "info"],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=10,
-            )
-            running = result.returncode == 0
+            ) == 0
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
         
@@ -57,26 +104,35 @@ class DockerCheck(BaseCheck):
     
     def _check_compose(self) -> str | None:
         """Check Docker Compose installation."""
-        # Try docker compose (v2)
-        try:
-            result = subprocess.run(
-                ["docker", "compose", "version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                # Parse "Docker Compose version v2.23.0"
-                version = result.stdout.strip()
-                if "version" in version.lower():
-                    version = version.split("version")[-1].strip()
-                return version
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        # Compose v2 registers itself as a CLI plugin in `docker info`
+        plugins = None
+        if self._docker_info:
+            plugins = (self._docker_info.get("ClientInfo") or {}).get("Plugins")
+        if plugins is not None:
+            for plugin in plugins:
+                if plugin.get("Name") == "compose" and plugin.get("Version"):
+                    return plugin["Version"]
+        elif _which("docker"):
+            # No plugin list to consult: try docker compose (v2)
+            try:
+                result = subprocess.run(
+                    ["docker", "compose", "version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=10,
+                )
+                if result.returncode == 0:
+                    # Parse "Docker Compose version v2.23.0"
+                    version = result.stdout.strip()
+                    if "version" in version.lower():
+                        version = version.split("version")[-1].strip()
+                    return version
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                pass
         
         # Try docker-compose (v1)
         try:
-            compose_path = shutil.which("docker-compose")
+            compose_path = _which("docker-compose")
             if compose_path:
                 result = subprocess.run(
                     ["docker-compose", "--version"],
@@ -1,11 +1,18 @@
 """OpenClaw folder structure check."""
 
 import os
-import sys
+import stat
 from pathlib import Path
 
+from ._paths import candidate_homes, find_home
 from .base import BaseCheck, CheckResult, CheckStatus
 
+# Process identity for permission checks (POSIX only)
+_EUID: int | None = os.geteuid() if hasattr(os, "geteuid") else None
+_GROUPS: frozenset[int] = (
+    frozenset(os.getgroups()) | {os.getegid()} if _EUID is not None else frozenset()
+)
+
 
 class FoldersCheck(BaseCheck):
     """Check OpenClaw folder structure and directories."""
@@ -14,16 +21,30 @@ class FoldersCheck(BaseCheck):
     description = "Checks OpenClaw directory structure"
     
     # Expected directories in OpenClaw home
-    EXPECTED_DIRS = [
+    EXPECTED_DIRS = (
         "skills",
-        "channels", 
+        "channels",
         "workspaces",
-    ]
+    )
     
     # Expected files
-    EXPECTED_FILES = [
+    EXPECTED_FILES = (
         "config.yaml",
-    ]
+    )
+    
+    _EXPECTED_DIR_NAMES = frozenset(EXPECTED_DIRS)
+    _EXPECTED_FILE_NAMES = frozenset(EXPECTED_FILES) | {
+        name.replace(".yaml", ".yml") for name in EXPECTED_FILES
+    }
+    
+    __slots__ = (
+        "_home_dir",
+        "_missing_dirs",
+        "_missing_files",
+        "_found_dirs",
+        "_found_files",
+        "_permission_issues",
+    )
     
     def __init__(self):
         self._home_dir: Path | None = None
@@ -35,32 +56,28 @@ class FoldersCheck(BaseCheck):
     
     def _find_openclaw_home(self) -> Path | None:
         """Find the OpenClaw home directory."""
-        home = Path.home()
-        
-        possible_paths = [
-            home / ".openclaw",
-            home / ".config" / "openclaw",
-        ]
-        
-        if sys.platform == "win32":
-            possible_paths.append(home / "AppData" / "Local" / "openclaw")
-        
-        for path in possible_paths:
-            if path.exists():
-                return path
-        
-        return None
+        home = find_home()
+        return Path(home) if home else None
     
-    def _check_permissions(self, path: Path) -> bool:
+    def _check_permissions(self, path: Path | str, entry: os.DirEntry | None = None) -> bool:
         """Check if path is readable and writable."""
         try:
-            # Check read
-            if not os.access(path, os.R_OK):
-                return False
-            # Check write
-            if not os.access(path, os.W_OK):
-                return False
-            return True
+            if _EUID is None:
+                # No POSIX ownership on Windows; ask the OS in one call
+                return os.access(path, os.R_OK | os.W_OK)
+            if _EUID == 0:
+                return True
+            
+            # One stat and a mode check instead of two access() calls;
+            # a scandir entry may already hold the stat result
+            st = entry.stat() if entry is not None else os.stat(path)
+            if st.st_uid == _EUID:
+                needed = stat.S_IRUSR | stat.S_IWUSR
+            elif st.st_gid in _GROUPS:
+                needed = stat.S_IRGRP | stat.S_IWGRP
+            else:
+                needed = stat.S_IROTH | stat.S_IWOTH
+            return st.st_mode & needed == needed
         except Exception:
             return False
     
@@ -90,27 +107,41 @@ class FoldersCheck(BaseCheck):
         if not self._check_permissions(self._home_dir):
             self._permission_issues.append(str(self._home_dir))
         
+        # List the home directory once; DirEntry type checks use the d_type
+        # from readdir instead of a stat per expected path
+        dir_entries: dict[str, os.DirEntry] = {}
+        file_names: set[str] = set()
+        try:
+            with os.scandir(self._home_dir) as it:
+                for entry in it:
+                    if entry.name in self._EXPECTED_DIR_NAMES:
+                        if entry.is_dir():
+                            dir_entries[entry.name] = entry
+                    elif entry.name in self._EXPECTED_FILE_NAMES:
+                        file_names.add(entry.name)
+        except OSError:
+            pass
+        
         # Check expected directories
         for dir_name in self.EXPECTED_DIRS:
-            dir_path = self._home_dir / dir_name
-            if dir_path.exists():
+            if dir_name in dir_entries:
                 self._found_dirs.append(dir_name)
-                if not self._check_permissions(dir_path):
-                    self._permission_issues.append(str(dir_path))
+                entry = dir_entries[dir_name]
+                if not self._check_permissions(entry.path, entry):
+                    self._permission_issues.append(entry.path)
             else:
                 self._missing_dirs.append(dir_name)
         
         # Check expected files
         for file_name in self.EXPECTED_FILES:
-            file_path = self._home_dir / file_name
-            if file_path.exists():
+            if file_name in file_names:
                 self._found_files.append(file_name)
             else:
                 # Also check .yml extension
                 if file_name.endswith(".yaml"):
-                    yml_path = self._home_dir / file_name.replace(".yaml", ".yml")
-                    if yml_path.exists():
-                        self._found_files.append(file_name.replace(".yaml", ".yml"))
+                    yml_name = file_name.replace(".yaml", ".yml")
+                    if yml_name in file_names:
+                        self._found_files.append(yml_name)
                     else:
                         self._missing_files.append(file_name)
                 else:
@@ -162,8 +193,7 @@ class FoldersCheck(BaseCheck):
         
         if not self._home_dir:
             # Create home directory
-            home = Path.home()
-            self._home_dir = home / ".openclaw"
+            self._home_dir = Path(candidate_homes()[0])
             
             print_fix_action(f"Creating OpenClaw home: {self._home_dir}")
             try:
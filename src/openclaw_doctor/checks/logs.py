@@ -1,15 +1,20 @@
 """OpenClaw logs parsing check."""
 
+import fnmatch
+import itertools
+import os
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from pathlib import Path
 
+from ._paths import HOME, candidate_files
 from .base import BaseCheck, CheckResult, CheckStatus
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LogError:
     """Represents a parsed error from logs."""
     pattern: str
@@ -20,7 +25,7 @@ class LogError:
 
 
 # Common error patterns with plain language explanations
-ERROR_PATTERNS: list[LogError] = [
+ERROR_PATTERNS: tuple[LogError, ...] = (
     # API Rate Limits
     LogError(
         pattern=r"rate.?limit|too.?many.?requests|429",
@@ -130,7 +135,72 @@ ERROR_PATTERNS: list[LogError] = [
         suggestion="Re-authenticate the channel. Check your API tokens.",
         severity="warning",
     ),
-]
+)
+
+
+def _compile_scanner(pattern: bytes):
+    """Compile with RE2 (linear-time DFA) when installed, else with re."""
+    try:
+        import re2
+        return re2.compile(pattern)
+    except Exception:  # not installed, or pattern unsupported by RE2
+        return re.compile(pattern)
+
+
+# All patterns fused into one alternation so each buffer is scanned once;
+# the name of the matching group identifies the pattern. Compiled as bytes
+# so it can run over the raw file bytes without decoding them first.
+_COMBINED_RE = _compile_scanner(
+    b"(?i)" + b"|".join(
+        f"(?P<g{i}>{error.pattern})".encode() for i, error in enumerate(ERROR_PATTERNS)
+    )
+)
+# Keyed by str and bytes: re reports lastgroup as str, but RE2 gives bytes
+# for a bytes pattern
+_GROUP_TO_INDEX = {f"g{i}": i for i in range(len(ERROR_PATTERNS))}
+_GROUP_TO_INDEX.update({name.encode(): i for name, i in list(_GROUP_TO_INDEX.items())})
+
+# Lowercase literals of which every alternative in ERROR_PATTERNS contains
+# at least one. A window with none of them cannot match, so clean logs are
+# ruled out with plain substring searches instead of the regex.
+_ANCHORS: tuple[bytes, ...] = (
+    b"rate", b"too", b"429", b"401", b"402", b"invalid", b"auth", b"quota",
+    b"billing", b"payment", b"connection", b"econn", b"time", b"enotfound",
+    b"dns", b"resolution", b"ssl", b"cert", b"tls", b"config", b"yaml",
+    b"syntax", b"permission", b"acces", b"memory", b"enomem", b"model",
+    b"context", b"token", b"skill", b"channel",
+)
+_ANCHOR_OVERLAP = max(map(len, _ANCHORS)) - 1
+
+# Bytes lowercased at a time by the anchor prefilter
+_PREFILTER_CHUNK = 16 * 1024
+
+
+def _has_anchor(buffer, start: int, end: int) -> bool:
+    """Whether buffer[start:end] contains any anchor, ignoring ASCII case.
+    
+    Lowercases in fixed-size chunks (overlapping by one anchor length) so
+    peak memory stays at one chunk however large the scan window is.
+    """
+    for pos in range(start, end, _PREFILTER_CHUNK):
+        chunk = buffer[pos:min(pos + _PREFILTER_CHUNK + _ANCHOR_OVERLAP, end)].lower()
+        if any(anchor in chunk for anchor in _ANCHORS):
+            return True
+    return False
+
+
+# Log directory names looked for in each candidate OpenClaw home
+_LOG_DIR_NAMES = ("logs", "log")
+
+# Windows apps may also log under the roaming profile
+_EXTRA_LOG_DIRS: tuple[str, ...] = (
+    (os.path.join(HOME, "AppData", "Roaming", "openclaw", "logs"),) if sys.platform == "win32" else ()
+)
+
+# Common log file patterns, fused so overlapping ones (openclaw*.log) are
+# matched once; case-insensitive like the filesystems on Windows and macOS
+_LOG_FILE_PATTERNS = ("*.log", "*.txt", "error*", "openclaw*")
+_LOG_FILE_RE = re.compile("(?i)" + "|".join(fnmatch.translate(p) for p in _LOG_FILE_PATTERNS))
 
 
 class LogsCheck(BaseCheck):
@@ -143,6 +213,8 @@ class LogsCheck(BaseCheck):
     MAX_LOG_AGE_HOURS = 24
     MAX_ERRORS_TO_SHOW = 5
     
+    __slots__ = ("_log_dir", "_log_files", "_found_errors")
+    
     def __init__(self):
         self._log_dir: Path | None = None
         self._log_files: list[Path] = []
@@ -150,78 +222,96 @@ class LogsCheck(BaseCheck):
     
     def _find_log_directory(self) -> Path | None:
         """Find OpenClaw log directory."""
-        home = Path.home()
-        
-        possible_paths = [
-            home / ".openclaw" / "logs",
-            home / ".openclaw" / "log",
-            home / ".config" / "openclaw" / "logs",
-        ]
-        
-        if sys.platform == "win32":
-            possible_paths.extend([
-                home / "AppData" / "Local" / "openclaw" / "logs",
-                home / "AppData" / "Roaming" / "openclaw" / "logs",
-            ])
-        
-        for path in possible_paths:
-            if path.exists() and path.is_dir():
-                return path
+        for path in (*candidate_files(*_LOG_DIR_NAMES), *_EXTRA_LOG_DIRS):
+            if os.path.isdir(path):
+                return Path(path)
         
         return None
     
     def _find_log_files(self, log_dir: Path) -> list[Path]:
         """Find recent log files."""
-        log_files = []
-        cutoff_time = datetime.now() - timedelta(hours=self.MAX_LOG_AGE_HOURS)
-        
-        # Look for common log file patterns
-        patterns = ["*.log", "*.txt", "error*", "openclaw*"]
+        cutoff_time = time.time() - self.MAX_LOG_AGE_HOURS * 3600
         
-        for pattern in patterns:
-            for log_file in log_dir.glob(pattern):
-                if log_file.is_file():
+        # One directory listing; each entry is stat'ed at most once
+        recent: list[tuple[float, str]] = []
+        try:
+            with os.scandir(log_dir) as it:
+                for entry in it:
+                    if not _LOG_FILE_RE.match(entry.name):
+                        continue
                     try:
-                        mtime = datetime.fromtimestamp(log_file.stat().st_mtime)
+                        # d_type answers this without a syscall; only
+                        # symlinks pay for following the link to its target
+                        if entry.is_symlink():
+                            if not entry.is_file():
+                                continue
+                            mtime = entry.stat().st_mtime
+                        elif entry.is_file(follow_symlinks=False):
+                            mtime = entry.stat(follow_symlinks=False).st_mtime
+                        else:
+                            continue
                         if mtime > cutoff_time:
-                            log_files.append(log_file)
-                    except Exception:
+                            recent.append((mtime, entry.path))
+                    except OSError:
                         pass
+        except OSError:
+            return []
         
-        return sorted(log_files, key=lambda f: f.stat().st_mtime, reverse=True)
+        recent.sort(reverse=True)
+        return [Path(path) for _, path in recent]
     
     def _parse_log_file(self, log_file: Path) -> list[tuple[LogError, str]]:
         """Parse a log file for known error patterns."""
         errors_found = []
         
         try:
-            # Read last portion of large files
+            # Scan last portion of large files
             max_bytes = 100 * 1024  # 100KB max per file
             
-            with open(log_file, "r", encoding="utf-8", errors="ignore") as f:
-                # Seek to end minus max_bytes for large files
-                f.seek(0, 2)  # Go to end
-                file_size = f.tell()
-                if file_size > max_bytes:
-                    f.seek(file_size - max_bytes)
-                    f.readline()  # Skip partial line
-                else:
-                    f.seek(0)
-                
-                content = f.read()
+            # Read only the tail window and scan the raw bytes; only matched
+            # lines get decoded. A plain read, not mmap: the file may be
+            # truncated under us by log rotation, which SIGBUSes a mapping.
+            with open(log_file, "rb") as f:
+                offset = max(0, os.fstat(f.fileno()).st_size - max_bytes)
+                if hasattr(os, "pread"):
+                    buf = os.pread(f.fileno(), max_bytes, offset)
+                else:  # Windows
+                    f.seek(offset)
+                    buf = f.read(max_bytes)
+            
+            size = len(buf)
+            start = 0
+            if offset:
+                # Skip the partial line at the window start
+                newline = buf.find(b"\n")
+                start = size if newline == -1 else newline + 1
+            
+            if not _has_anchor(buf, start, size):
+                return []
+            
+            # Scan once for all patterns, keeping the first line for each.
+            # Each search resumes one byte past the previous match start, not
+            # at its end like finditer, so a pattern overlapping an earlier
+            # match (e.g. "ETIMEDOUT of memory") is still found.
+            first_lines: dict[int, str] = {}
+            match = _COMBINED_RE.search(buf, start, size)
+            while match:
+                index = _GROUP_TO_INDEX[match.lastgroup]
+                if index not in first_lines:
+                    line_start = max(buf.rfind(b"\n", start, match.start()) + 1, start)
+                    line_end = buf.find(b"\n", match.end())
+                    if line_end == -1:
+                        line_end = size
+                    line = buf[line_start:line_end].decode("utf-8", "ignore")
+                    first_lines[index] = line.strip()[:100]
+                    if len(first_lines) == len(ERROR_PATTERNS):
+                        break
+                match = _COMBINED_RE.search(buf, match.start() + 1, size)
             
-            # Check each error pattern
-            for error in ERROR_PATTERNS:
-                if re.search(error.pattern, content, re.IGNORECASE):
-                    # Find the actual line containing the error
-                    for line in content.split("\n"):
-                        if re.search(error.pattern, line, re.IGNORECASE):
-                            errors_found.append((error, line.strip()[:100]))
-                            break
-                    else:
-                        errors_found.append((error, ""))
+            errors_found = [(ERROR_PATTERNS[i], first_lines[i]) for i in sorted(first_lines)]
         
-        except Exception:
+        except OSError:
+            # Unreadable or vanished
             pass
         
         return errors_found
@@ -250,11 +340,12 @@ class LogsCheck(BaseCheck):
                 details=f"Checked {self._log_dir} for logs from last {self.MAX_LOG_AGE_HOURS}h",
             )
         
-        # Parse each log file
-        for log_file in self._log_files[:5]:  # Check up to 5 most recent
-            errors = self._parse_log_file(log_file)
-            for error, line in errors:
-                self._found_errors.append((error, line, log_file))
+        # Parse each log file; reads release the GIL, so overlap them
+        recent_files = self._log_files[:5]  # Check up to 5 most recent
+        with ThreadPoolExecutor(max_workers=len(recent_files)) as executor:
+            for log_file, errors in zip(recent_files, executor.map(self._parse_log_file, recent_files)):
+                for error, line in errors:
+                    self._found_errors.append((error, line, log_file))
         
         if not self._found_errors:
             return CheckResult(
@@ -264,28 +355,35 @@ class LogsCheck(BaseCheck):
                 details=f"Log directory: {self._log_dir}",
             )
         
-        # Count by severity
-        error_count = sum(1 for e, _, _ in self._found_errors if e.severity == "error")
-        warning_count = sum(1 for e, _, _ in self._found_errors if e.severity == "warning")
-        
-        status = CheckStatus.FAIL if error_count > 0 else CheckStatus.WARN
-        
-        # Build details
+        # Count severities, group by unique error and collect the first
+        # suggestions in one pass
+        error_count = warning_count = 0
         unique_errors = {}
+        suggestions = []
         for error, line, file in self._found_errors:
             if error.message not in unique_errors:
                 unique_errors[error.message] = (error, line, file)
+                if len(suggestions) < 3:
+                    suggestions.append(error.suggestion)
+            if error.severity == "error":
+                error_count += 1
+            elif error.severity == "warning":
+                warning_count += 1
         
-        details_lines = []
-        for msg, (error, line, file) in list(unique_errors.items())[:self.MAX_ERRORS_TO_SHOW]:
-            details_lines.append(f"• {error.message}: {error.explanation}")
+        status = CheckStatus.FAIL if error_count > 0 else CheckStatus.WARN
+        
+        # Build details
+        details_lines = [
+            f"• {error.message}: {error.explanation}"
+            for error, _, _ in itertools.islice(unique_errors.values(), self.MAX_ERRORS_TO_SHOW)
+        ]
         
         return CheckResult(
             name=self.name,
             status=status,
             message=f"Found {len(unique_errors)} issue(s) in logs",
             details="\n".join(details_lines),
-            fix_suggestions=[e.suggestion for e, _, _ in list(unique_errors.values())[:3]],
+            fix_suggestions=suggestions,
         )
     
     def fix(self) -> bool:
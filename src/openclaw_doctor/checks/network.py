@@ -1,9 +1,15 @@
 """Network connectivity check."""
 
-import httpx
+import asyncio
+import os
+from urllib.parse import urlsplit
 
 from .base import BaseCheck, CheckResult, CheckStatus
 
+# A raw TCP connect can't go through a proxy, so fall back to HTTP probes
+# (which httpx routes via these variables) when one is configured
+_PROXY_ENV_VARS = ("HTTPS_PROXY", "https_proxy", "ALL_PROXY", "all_proxy")
+
 
 class NetworkCheck(BaseCheck):
     """Check network connectivity to AI providers."""
@@ -11,14 +17,22 @@ class NetworkCheck(BaseCheck):
     name = "Network"
     description = "Tests connectivity to AI providers"
     
-    # Endpoints to test
+    # Endpoints to test, as (host, port)
     ENDPOINTS = {
-        "Anthropic": "https://api.anthropic.com",
-        "OpenAI": "https://api.openai.com",
-        "Google AI": "https://generativelanguage.googleapis.com",
-        "Groq": "https://api.groq.com",
+        name: (urlsplit(url).hostname, urlsplit(url).port or 443)
+        for name, url in {
+            "Anthropic": "https://api.anthropic.com",
+            "OpenAI": "https://api.openai.com",
+            "Google AI": "https://generativelanguage.googleapis.com",
+            "Groq": "https://api.groq.com",
+        }.items()
     }
     
+    CONNECT_TIMEOUT = 5.0
+    HTTP_TIMEOUT = 10.0
+    
+    __slots__ = ("_reachable", "_unreachable")
+    
     def __init__(self):
         self._reachable: list[str] = []
         self._unreachable: list[str] = []
@@ -28,18 +42,7 @@ class NetworkCheck(BaseCheck):
         self._reachable = []
         self._unreachable = []
         
-        for name, url in self.ENDPOINTS.items():
-            try:
-                with httpx.Client(timeout=10.0) as client:
-                    response = client.head(url)
-                    # Any response (even 4xx for auth) means we can reach the server
-                    self._reachable.append(name)
-            except httpx.TimeoutException:
-                self._unreachable.append(f"{name} (timeout)")
-            except httpx.ConnectError:
-                self._unreachable.append(f"{name} (connection failed)")
-            except Exception as e:
-                self._unreachable.append(f"{name} ({type(e).__name__})")
+        asyncio.run(self._probe_all())
         
         if not self._reachable:
             return CheckResult(
@@ -66,6 +69,51 @@ class NetworkCheck(BaseCheck):
             details=f"Reachable: {', '.join(self._reachable)}",
         )
     
+    async def _probe_all(self) -> None:
+        """Probe every endpoint concurrently."""
+        timeout_errors: tuple[type[BaseException], ...] = (asyncio.TimeoutError,)
+        connect_errors: tuple[type[BaseException], ...] = (OSError,)
+        
+        if any(os.environ.get(var) for var in _PROXY_ENV_VARS):
+            # httpx is slow to import, so only the proxy path pays for it
+            import httpx
+            
+            timeout_errors += (httpx.TimeoutException,)
+            connect_errors += (httpx.ConnectError,)
+            async with httpx.AsyncClient(timeout=self.HTTP_TIMEOUT) as client:
+                urls = [f"https://{host}:{port}" for host, port in self.ENDPOINTS.values()]
+                results = await asyncio.gather(
+                    *(client.head(url) for url in urls),
+                    return_exceptions=True,
+                )
+        else:
+            results = await asyncio.gather(
+                *(self._connect(host, port) for host, port in self.ENDPOINTS.values()),
+                return_exceptions=True,
+            )
+        
+        for name, result in zip(self.ENDPOINTS, results):
+            # TimeoutError subclasses OSError, so test it first
+            if isinstance(result, timeout_errors):
+                self._unreachable.append(f"{name} (timeout)")
+            elif isinstance(result, connect_errors):
+                self._unreachable.append(f"{name} (connection failed)")
+            elif isinstance(result, BaseException):
+                self._unreachable.append(f"{name} ({type(result).__name__})")
+            else:
+                # Any response (even 4xx for auth) means we can reach the server
+                self._reachable.append(name)
+    
+    async def _connect(self, host: str, port: int) -> None:
+        """Open and close a plain TCP connection; no TLS or HTTP needed."""
+        # Passing the hostname lets asyncio try every resolved address,
+        # racing IPv6 and IPv4 so a dead route doesn't fail the probe
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, happy_eyeballs_delay=0.25),
+            timeout=self.CONNECT_TIMEOUT,
+        )
+        writer.close()
+    
     def _get_suggestions(self) -> list[str]:
         """Get network troubleshooting suggestions."""
         return [
@@ -1,5 +1,7 @@
 """Node.js version check."""
 
+import functools
+import os
 import re
 import shutil
 import subprocess
@@ -7,6 +9,60 @@ import sys
 
 from .base import BaseCheck, CheckResult, CheckStatus
 
+# Version macros in the header shipped alongside the node binary
+_VERSION_HEADER_RE = re.compile(
+    rb"#define NODE_(MAJOR|MINOR|PATCH)_VERSION[ \t]+(\d+)"
+)
+
+
+def _read_header_version(node_path: str) -> tuple[int, ...] | None:
+    """Read the version from include/node/node_version.h next to the binary.
+    
+    Official tarballs, nvm, Homebrew and distro packages all install it,
+    and reading it is far cheaper than starting node.
+    """
+    prefix = os.path.dirname(os.path.dirname(os.path.realpath(node_path)))
+    header = os.path.join(prefix, "include", "node", "node_version.h")
+    try:
+        with open(header, "rb") as f:
+            parts = dict(_VERSION_HEADER_RE.findall(f.read()))
+        return int(parts[b"MAJOR"]), int(parts[b"MINOR"]), int(parts[b"PATCH"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_node_info(path_env: str) -> tuple[str | None, tuple[int, ...] | None]:
+    """Get Node.js path and version, cached per PATH value."""
+    node_path = shutil.which("node", path=path_env or None)
+    if not node_path:
+        return None, None
+    
+    version = _read_header_version(node_path)
+    if version:
+        return node_path, version
+    
+    # No header installed; ask the binary
+    try:
+        result = subprocess.run(
+            [node_path, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        if result.returncode != 0:
+            return node_path, None
+        
+        # Parse version string like "v20.10.0"
+        version_str = result.stdout.strip()
+        match = re.match(r"v?(\d+)\.(\d+)\.(\d+)", version_str)
+        if match:
+            version = tuple(int(x) for x in match.groups())
+            return node_path, version
+        return node_path, None
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return node_path, None
+
 
 class NodeJSCheck(BaseCheck):
     """Check if Node.js is installed and meets version requirements."""
@@ -15,35 +71,15 @@ class NodeJSCheck(BaseCheck):
     description = "Verifies Node.js >= 18.x is installed"
     min_version = (18, 0, 0)
     
+    __slots__ = ("_version", "_path")
+    
     def __init__(self):
         self._version: tuple[int, ...] | None = None
         self._path: str | None = None
     
     def _get_node_info(self) -> tuple[str | None, tuple[int, ...] | None]:
         """Get Node.js path and version."""
-        node_path = shutil.which("node")
-        if not node_path:
-            return None, None
-        
-        try:
-            result = subprocess.run(
-                ["node", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode != 0:
-                return node_path, None
-            
-            # Parse version string like "v20.10.0"
-            version_str = result.stdout.strip()
-            match = re.match(r"v?(\d+)\.(\d+)\.(\d+)", version_str)
-            if match:
-                version = tuple(int(x) for x in match.groups())
-                return node_path, version
-            return node_path, None
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return node_path, None
+        return _cached_node_info(os.environ.get("PATH", ""))
     
     def run(self) -> CheckResult:
         """Run the Node.js check."""
@@ -1,13 +1,68 @@
 """OpenClaw installation check."""
 
+import functools
 import os
-import shutil
+import re
 import subprocess
 import sys
 from pathlib import Path
 
+from ._paths import find_home
 from .base import BaseCheck, CheckResult, CheckStatus
 
+# CLI names to look for, in order of preference
+_CLI_NAMES = ("openclaw", "oc", "claw")
+
+# `openclaw --version` output: the first token starting with a digit, after
+# an optional name, "version" and "v", e.g. "OpenClaw version v1.2.3"
+_VERSION_RE = re.compile(r"(?i)(?:openclaw\W*)?(?:version\s*)?v?(\d\S*)")
+
+# Contents of a VERSION file worth trusting, e.g. "1.4.2" or "v1.4.2-beta.1"
+_VERSION_FILE_RE = re.compile(r"v?(\d+\.\d+\.\d+[0-9A-Za-z.+-]*)")
+
+
+def _parse_version(output: str) -> str | None:
+    """Clean up `--version` output, e.g. "openclaw v1.2.3" -> "1.2.3"."""
+    output = output.strip()
+    match = _VERSION_RE.search(output)
+    return match.group(1) if match else output or None
+
+
+@functools.cache
+def _find_in_path(names: tuple[str, ...], path_env: str) -> str | None:
+    """Find the first of several executables in one walk over PATH.
+    
+    Like shutil.which, an earlier name wins over a later one even if the
+    later one sits in an earlier directory. On Windows each name is also
+    tried with the PATHEXT extensions.
+    """
+    if sys.platform == "win32":
+        exts = [ext.lower() for ext in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep) if ext]
+        candidates = {
+            name: (name,) if any(name.lower().endswith(ext) for ext in exts) else tuple(name + ext for ext in exts)
+            for name in names
+        }
+    else:
+        candidates = {name: (name,) for name in names}
+    
+    found: dict[str, str] = {}
+    for directory in path_env.split(os.pathsep):
+        if not directory:
+            continue
+        for name in names:
+            if name in found:
+                continue
+            for candidate in candidates[name]:
+                full_path = os.path.join(directory, candidate)
+                if os.path.isfile(full_path) and os.access(full_path, os.X_OK):
+                    found[name] = full_path
+                    break
+        if names[0] in found:
+            # Nothing can beat the preferred name
+            break
+    
+    return next((found[name] for name in names if name in found), None)
+
 
 class OpenClawCheck(BaseCheck):
     """Check if OpenClaw is installed and functioning."""
@@ -15,65 +70,74 @@ class OpenClawCheck(BaseCheck):
     name = "OpenClaw"
     description = "Checks OpenClaw CLI installation"
     
+    __slots__ = ("_version", "_path", "_home_dir")
+    
     def __init__(self):
         self._version: str | None = None
         self._path: str | None = None
         self._home_dir: Path | None = None
     
+    def _read_version_file(self, openclaw_path: str) -> str | None:
+        """Read a VERSION file shipped next to the CLI or in the OpenClaw home."""
+        candidates = [Path(openclaw_path).resolve().parent / "VERSION"]
+        if self._home_dir:
+            candidates.append(self._home_dir / "VERSION")
+        
+        for path in candidates:
+            try:
+                match = _VERSION_FILE_RE.fullmatch(path.read_text(encoding="utf-8").strip())
+            except (OSError, UnicodeDecodeError):
+                continue
+            if match:
+                return match.group(1)
+        
+        return None
+    
     def _get_openclaw_info(self) -> tuple[str | None, str | None]:
         """Get OpenClaw path and version."""
-        # Check for openclaw CLI
-        openclaw_path = shutil.which("openclaw")
-        if not openclaw_path:
-            # Also check common alternative names
-            for name in ["openclaw", "oc", "claw"]:
-                openclaw_path = shutil.which(name)
-                if openclaw_path:
-                    break
+        # An OPENCLAW_HOME install keeps the CLI in its bin directory
+        openclaw_path = None
+        env_home = os.environ.get("OPENCLAW_HOME")
+        if env_home:
+            openclaw_path = _find_in_path(_CLI_NAMES[:1], os.path.join(env_home, "bin"))
         
+        # Otherwise check PATH for openclaw CLI, then common alternative names
+        if not openclaw_path:
+            openclaw_path = _find_in_path(_CLI_NAMES, os.environ.get("PATH", os.defpath))
         if not openclaw_path:
             return None, None
         
+        # A VERSION file is far cheaper to read than spawning the CLI
+        version = self._read_version_file(openclaw_path)
+        if version:
+            return openclaw_path, version
+        
         try:
+            # Only stdout is read, so don't set up pipes for stdin or stderr
             result = subprocess.run(
                 [openclaw_path, "--version"],
-                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 timeout=10,
             )
             if result.returncode == 0:
-                version = result.stdout.strip()
-                # Clean up version string
-                if version.startswith("openclaw"):
-                    version = version.replace("openclaw", "").strip()
-                if version.startswith("v"):
-                    version = version[1:]
-                return openclaw_path, version
+                return openclaw_path, _parse_version(result.stdout)
             return openclaw_path, None
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return openclaw_path, None
     
     def _get_home_directory(self) -> Path | None:
         """Get the OpenClaw home directory."""
-        # Check common locations
-        home = Path.home()
-        
-        possible_paths = [
-            home / ".openclaw",
-            home / ".config" / "openclaw",
-            home / "AppData" / "Local" / "openclaw" if sys.platform == "win32" else None,
-        ]
-        
-        for path in possible_paths:
-            if path and path.exists():
-                return path
-        
-        return None
+        home = find_home()
+        return Path(home) if home else None
     
     def run(self) -> CheckResult:
         """Run the OpenClaw check."""
-        self._path, self._version = self._get_openclaw_info()
+        # The home directory may hold a VERSION file, so find it first
         self._home_dir = self._get_home_directory()
+        self._path, self._version = self._get_openclaw_info()
         
         if not self._path:
             return CheckResult(
@@ -128,18 +192,45 @@ class OpenClawCheck(BaseCheck):
         
         try:
             console.print("[dim]Running install script...[/dim]")
-            result = subprocess.run(
-                ["bash", "-c", "curl -fsSL https://openclawd.ai/install.sh | bash"],
-                capture_output=True,
-                text=True,
-                timeout=120,
+            # Stream the script from curl straight into bash, with no shell in
+            # between; the installer's output is shown live
+            curl = subprocess.Popen(
+                ["curl", "-fsSL", "https://openclawd.ai/install.sh"],
+                stdout=subprocess.PIPE,
             )
+            try:
+                installer = subprocess.Popen(["bash"], stdin=curl.stdout)
+            except OSError:
+                curl.kill()
+                curl.wait()
+                raise
+            finally:
+                # bash has its own copy; this lets curl see a closed pipe
+                curl.stdout.close()
             
-            if result.returncode == 0:
+            try:
+                installer.wait(timeout=120)
+                curl.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                for proc in (installer, curl):
+                    proc.kill()
+                    proc.wait()
+                raise
+            
+            # A failed download still feeds bash an empty (successful) script,
+            # so both ends have to succeed
+            if curl.returncode == 0 and installer.returncode == 0:
                 console.print("[green]OpenClaw installed successfully![/green]")
+                # Let the next lookup find the new binary
+                _find_in_path.cache_clear()
                 return True
             else:
-                console.print(f"[red]Installation failed:[/red] {result.stderr}")
+                reason = (
+                    f"download failed (curl exit {curl.returncode})"
+                    if curl.returncode != 0
+                    else f"install script exited with {installer.returncode}"
+                )
+                console.print(f"[red]Installation failed:[/red] {reason}")
                 print_suggestion(
                     "Manual Installation",
                     [
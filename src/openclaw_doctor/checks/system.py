@@ -1,12 +1,58 @@
 """System requirements check (RAM, disk space, CPU)."""
 
+import os
+import re
 import shutil
 import sys
 
-import psutil
-
 from .base import BaseCheck, CheckResult, CheckStatus
 
+_MEMTOTAL_RE = re.compile(rb"MemTotal:\s+(\d+) kB")
+
+
+def _total_memory_bytes() -> int:
+    """Total physical memory, without psutil where the OS makes it cheap."""
+    if sys.platform.startswith("linux"):
+        # MemTotal is the first line of /proc/meminfo
+        try:
+            with open("/proc/meminfo", "rb") as f:
+                match = _MEMTOTAL_RE.search(f.read(128))
+            if match:
+                return int(match.group(1)) * 1024
+        except OSError:
+            pass
+    
+    if sys.platform != "win32":
+        try:
+            return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (ValueError, OSError):
+            pass
+    
+    # psutil loads native extensions, so only pay for it when needed
+    import psutil
+    return psutil.virtual_memory().total
+
+
+def _cpu_count() -> int:
+    """CPUs this process may run on (respecting affinity where supported)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _free_disk_bytes(path: str) -> int:
+    """Bytes available to the current user on the filesystem holding path."""
+    if sys.platform == "win32":
+        import ctypes
+        
+        free = ctypes.c_ulonglong()
+        if ctypes.windll.kernel32.GetDiskFreeSpaceExW(path, ctypes.byref(free), None, None):
+            return free.value
+        return shutil.disk_usage(path).free
+    
+    st = os.statvfs(path)
+    return st.f_bavail * st.f_frsize
+
 
 class SystemCheck(BaseCheck):
     """Check system requirements for OpenClaw."""
@@ -20,6 +66,8 @@ class SystemCheck(BaseCheck):
     MIN_DISK_GB = 20
     MIN_CPU_CORES = 2
     
+    __slots__ = ("_ram_gb", "_disk_gb", "_cpu_cores", "_issues", "_warnings")
+    
     def __init__(self):
         self._ram_gb: float = 0
         self._disk_gb: float = 0
@@ -33,8 +81,7 @@ class SystemCheck(BaseCheck):
         self._warnings = []
         
         # Check RAM
-        mem = psutil.virtual_memory()
-        self._ram_gb = mem.total / (1024 ** 3)
+        self._ram_gb = _total_memory_bytes() / (1024 ** 3)
         
         if self._ram_gb < self.MIN_RAM_GB:
             self._issues.append(f"RAM: {self._ram_gb:.1f}GB (minimum {self.MIN_RAM_GB}GB required)")
@@ -47,14 +94,13 @@ class SystemCheck(BaseCheck):
         else:
             path = "/"
         
-        disk = shutil.disk_usage(path)
-        self._disk_gb = disk.free / (1024 ** 3)
+        self._disk_gb = _free_disk_bytes(path) / (1024 ** 3)
         
         if self._disk_gb < self.MIN_DISK_GB:
             self._issues.append(f"Disk: {self._disk_gb:.1f}GB free (minimum {self.MIN_DISK_GB}GB required)")
         
         # Check CPU cores
-        self._cpu_cores = psutil.cpu_count(logical=False) or psutil.cpu_count() or 1
+        self._cpu_cores = _cpu_count()
         
         if self._cpu_cores < self.MIN_CPU_CORES:
             self._warnings.append(f"CPU: {self._cpu_cores} cores (recommended {self.MIN_CPU_CORES}+)")
@@ -1,11 +1,14 @@
 """Rich console utilities for beautiful terminal output."""
 
+from typing import TYPE_CHECKING
+
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich import box
+
+# Renderables are imported where they're used, so commands that print
+# little (--version, list-checks) don't load them
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
 # Global console instance
 console = Console()
@@ -20,8 +23,17 @@ class StatusIcon:
     FIX = "[bold magenta]⚡[/bold magenta]"
 
 
+# Result prefixes, parsed from markup once rather than on every print
+_PASS_PREFIX = Text.from_markup(f"[{StatusIcon.PASS}] ")
+_WARN_PREFIX = Text.from_markup(f"[{StatusIcon.WARN}] ")
+_FAIL_PREFIX = Text.from_markup(f"[{StatusIcon.FAIL}] ")
+
+
 def print_header() -> None:
     """Print the OpenClaw Doctor header."""
+    from rich import box
+    from rich.panel import Panel
+    
     header = Panel(
         Text.from_markup(
             "[bold cyan]OpenClaw Doctor[/bold cyan] 🩺\n"
@@ -35,23 +47,37 @@ def print_header() -> None:
     console.print()
 
 
-def print_check_result(
+def format_check_result(
     name: str,
     passed: bool,
     message: str,
     warning: bool = False,
     details: str | None = None,
-) -> None:
-    """Print a single check result."""
+) -> Text:
+    """Format a single check result for printing."""
     if passed:
-        icon = StatusIcon.WARN if warning else StatusIcon.PASS
+        prefix = _WARN_PREFIX if warning else _PASS_PREFIX
     else:
-        icon = StatusIcon.FAIL
-    
-    console.print(f"[{icon}] {message}")
+        prefix = _FAIL_PREFIX
     
+    line = prefix + Text(message)
     if details:
-        console.print(f"    [dim]{details}[/dim]")
+        line.append("\n    ")
+        line.append(details, style="dim")
+    # Keep Rich's usual highlighting of numbers, paths and brackets
+    console.highlighter.highlight(line)
+    return line
+
+
+def print_check_result(
+    name: str,
+    passed: bool,
+    message: str,
+    warning: bool = False,
+    details: str | None = None,
+) -> None:
+    """Print a single check result."""
+    console.print(format_check_result(name, passed, message, warning, details))
 
 
 def print_fix_action(message: str) -> None:
@@ -61,6 +87,8 @@ def print_fix_action(message: str) -> None:
 
 def print_suggestion(title: str, steps: list[str]) -> None:
     """Print a suggestion box with steps to fix an issue."""
+    from rich.panel import Panel
+    
     suggestion_text = "\n".join(f"  {i+1}. {step}" for i, step in enumerate(steps))
     panel = Panel(
         suggestion_text,
@@ -73,9 +101,8 @@ def print_suggestion(title: str, steps: list[str]) -> None:
 
 def print_summary(passed: int, warnings: int, failed: int) -> None:
     """Print the summary of all checks."""
-    console.print()
-    console.rule(style="dim")
-    console.print()
+    from rich.console import Group
+    from rich.rule import Rule
     
     summary_parts = []
     if passed > 0:
@@ -85,20 +112,26 @@ def print_summary(passed: int, warnings: int, failed: int) -> None:
     if failed > 0:
         summary_parts.append(f"[red]{failed} failed[/red]")
     
-    console.print(f"[bold]Summary:[/bold] {', '.join(summary_parts)}")
-    
+    lines = ["", f"[bold]Summary:[/bold] {', '.join(summary_parts)}"]
     if failed > 0 or warnings > 0:
-        console.print()
-        console.print("[dim]To fix issues, run:[/dim] [bold cyan]openclaw-doctor --fix[/bold cyan]")
+        lines.append("")
+        lines.append("[dim]To fix issues, run:[/dim] [bold cyan]openclaw-doctor --fix[/bold cyan]")
+    
+    # Render everything in one print
+    console.print(Group("", Rule(style="dim"), "\n".join(lines)))
 
 
-def create_progress() -> Progress:
+def create_progress() -> "Progress":
     """Create a progress spinner for running checks."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
         transient=True,
+        # Nobody sees a spinner in a pipe or CI log; skip its refresh thread
+        disable=not console.is_terminal,
     )
 
 
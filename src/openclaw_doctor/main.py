@@ -5,12 +5,13 @@ import sys
 from typing import Optional
 
 import typer
-from rich.json import JSON as RichJSON
+from rich.text import Text
 
 from . import __version__
 from .console import (
     console,
     create_progress,
+    format_check_result,
     print_check_result,
     print_error,
     print_fix_action,
@@ -18,7 +19,27 @@ from .console import (
     print_success,
     print_summary,
 )
-from .checks import ALL_CHECKS, BaseCheck, CheckResult, CheckStatus
+from .checks import (
+    CHECK_NAMES,
+    BaseCheck,
+    CheckResult,
+    CheckStatus,
+    all_checks,
+    get_check_class,
+    run_all,
+)
+
+# Other accepted spellings of the registered check names, including display
+# names that don't normalize to one (e.g. "Node.js")
+_NAME_ALIASES: dict[str, str] = {
+    "node": "nodejs",
+    "node.js": "nodejs",
+    "claw": "openclaw",
+    "configuration": "config",
+    "apikeys": "api_keys",
+    "keys": "api_keys",
+    "net": "network",
+}
 
 app = typer.Typer(
     name="openclaw-doctor",
@@ -73,32 +94,33 @@ def run_all_checks(
     verbose: bool = False,
 ) -> tuple[list[CheckResult], int, int, int]:
     """Run all health checks and return results with counts."""
-    results: list[CheckResult] = []
     passed = 0
     warnings = 0
     failed = 0
     
+    checks: list[BaseCheck] = [check_class() for check_class in all_checks()]
+    
     with create_progress() as progress:
-        task = progress.add_task("Running health checks...", total=len(ALL_CHECKS))
+        task = progress.add_task("Running health checks...", total=len(checks))
         
-        for check_class in ALL_CHECKS:
-            check: BaseCheck = check_class()
-            progress.update(task, description=f"Checking {check.name}...")
-            
-            result = check.run()
-            results.append(result)
-            
+        # Checks run concurrently; the progress bar advances on this thread
+        # as each one finishes
+        def on_result(result: CheckResult) -> None:
+            progress.update(task, description=f"Checked {result.name}...")
             progress.advance(task)
+        
+        results = run_all(checks, on_result=on_result)
     
-    # Display results
+    # Display results in a single print
+    lines = []
     for result in results:
-        print_check_result(
+        lines.append(format_check_result(
             name=result.name,
             passed=result.passed,
             message=result.message,
             warning=result.is_warning,
             details=result.details if verbose else None,
-        )
+        ))
         
         if result.status == CheckStatus.PASS:
             passed += 1
@@ -106,29 +128,25 @@ def run_all_checks(
             warnings += 1
         else:
             failed += 1
+    console.print(Text("\n").join(lines))
     
     # Run fixes if requested
     if fix:
-        fixable_results = [r for r in results if not r.passed or r.is_warning]
-        if fixable_results:
+        # Each check instance still holds the state from its run, so fix()
+        # can use it directly without probing again
+        fixable = [(r, c) for r, c in zip(results, checks) if not r.passed or r.is_warning]
+        if fixable:
             console.print()
             console.rule("[bold magenta]Auto-Fix[/bold magenta]", style="magenta")
             console.print()
             
-            for result in fixable_results:
+            for result, check in fixable:
                 if result.can_auto_fix:
-                    check_class = next(
-                        (c for c in ALL_CHECKS if c.name == result.name),
-                        None
-                    )
-                    if check_class:
-                        check = check_class()
-                        check.run()  # Re-run to populate state
-                        print_fix_action(f"Attempting to fix: {result.name}")
-                        success = check.fix()
-                        if success:
-                            print_success(f"{result.name} fixed!")
-                        console.print()
+                    print_fix_action(f"Attempting to fix: {result.name}")
+                    success = check.fix()
+                    if success:
+                        print_success(f"{result.name} fixed!")
+                    console.print()
                 elif result.fix_suggestions:
                     console.print(f"[bold]{result.name}[/bold] - Manual fix required:")
                     for suggestion in result.fix_suggestions:
@@ -167,22 +185,46 @@ def doctor(
     """
     if json_output:
         # Quiet mode for JSON output
-        results: list[CheckResult] = []
-        for check_class in ALL_CHECKS:
-            check = check_class()
-            result = check.run()
-            results.append(result)
+        results = run_all()
+        
+        # Serialize and count statuses in one pass
+        counts = dict.fromkeys(CheckStatus, 0)
+        checks = []
+        for result in results:
+            checks.append(result.to_dict())
+            counts[result.status] += 1
         
         output = {
             "version": __version__,
-            "checks": [r.to_dict() for r in results],
+            "checks": checks,
             "summary": {
-                "passed": sum(1 for r in results if r.status == CheckStatus.PASS),
-                "warnings": sum(1 for r in results if r.status == CheckStatus.WARN),
-                "failed": sum(1 for r in results if r.status == CheckStatus.FAIL),
+                "passed": counts[CheckStatus.PASS],
+                "warnings": counts[CheckStatus.WARN],
+                "failed": counts[CheckStatus.FAIL],
             }
         }
-        console.print(RichJSON(json.dumps(output, indent=2)))
+        if console.is_terminal:
+            from rich.json import JSON as RichJSON
+            
+            console.print(RichJSON(json.dumps(output, indent=2)))
+        else:
+            # Piped to a file or another program: compact UTF-8 written
+            # straight to the byte stream, so Rich can't wrap the line
+            try:
+                # orjson is an optional speedup
+                from orjson import dumps as json_dumps
+            except ImportError:
+                def json_dumps(obj) -> bytes:
+                    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+            
+            data = json_dumps(output) + b"\n"
+            buffer = getattr(sys.stdout, "buffer", None)
+            if buffer is not None:
+                sys.stdout.flush()
+                buffer.write(data)
+                buffer.flush()
+            else:
+                sys.stdout.write(data.decode())
         
         # Exit with error code if any checks failed
         if output["summary"]["failed"] > 0:
@@ -227,35 +269,15 @@ def check(
     """
     # Find the check by name
     name_lower = name.lower().replace("-", "_").replace(" ", "_")
-    check_class: Optional[type[BaseCheck]] = None
-    
-    name_map = {
-        "nodejs": "Node.js",
-        "node": "Node.js",
-        "openclaw": "OpenClaw",
-        "claw": "OpenClaw",
-        "docker": "Docker",
-        "system": "System",
-        "config": "Config",
-        "configuration": "Config",
-        "api_keys": "API Keys",
-        "apikeys": "API Keys",
-        "keys": "API Keys",
-        "network": "Network",
-        "net": "Network",
-    }
-    
-    target_name = name_map.get(name_lower)
-    
-    for cls in ALL_CHECKS:
-        if cls.name == target_name or cls.name.lower() == name_lower:
-            check_class = cls
-            break
+    target_name = _NAME_ALIASES.get(name_lower, name_lower)
+    check_class: Optional[type[BaseCheck]] = (
+        get_check_class(target_name) if target_name in CHECK_NAMES else None
+    )
     
     if not check_class:
         print_error(f"Unknown check: {name}")
         console.print("\nAvailable checks:")
-        for cls in ALL_CHECKS:
+        for cls in all_checks():
             console.print(f"  • {cls.name.lower().replace(' ', '_')} - {cls.description}")
         raise typer.Exit(1)
     
@@ -293,7 +315,7 @@ def list_checks() -> None:
     """List all available health checks."""
     console.print("\n[bold]Available Health Checks:[/bold]\n")
     
-    for check_class in ALL_CHECKS:
+    for check_class in all_checks():
         console.print(f"  [cyan]{check_class.name}[/cyan]")
         console.print(f"    {check_class.description}")
         console.print()
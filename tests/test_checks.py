@@ -1,5 +1,9 @@
 """Tests for OpenClaw Doctor health checks."""
 
+import os
+import sys
+import time
+
 import pytest
 
 from openclaw_doctor.checks import (
@@ -7,6 +11,8 @@ from openclaw_doctor.checks import (
     BaseCheck,
     CheckResult,
     CheckStatus,
+    run_all,
+    APIKeysCheck,
     NodeJSCheck,
     SystemCheck,
     NetworkCheck,
@@ -89,6 +95,32 @@ class TestAllChecks:
             check = check_class()
             assert hasattr(check, "fix")
             assert callable(check.fix)
+    
+    def test_run_all_preserves_order(self):
+        checks = [SystemCheck(), NodeJSCheck()]
+        results = run_all(checks)
+        assert [r.name for r in results] == ["System", "Node.js"]
+    
+    def test_fix_reuses_checked_instance(self, monkeypatch):
+        from openclaw_doctor import main
+        
+        calls = []
+        
+        class FixableCheck(BaseCheck):
+            name = "Fixable"
+            
+            def run(self):
+                calls.append(("run", self))
+                return CheckResult(self.name, CheckStatus.WARN, "needs fixing", can_auto_fix=True)
+            
+            def fix(self):
+                calls.append(("fix", self))
+                return True
+        
+        monkeypatch.setattr(main, "all_checks", lambda: (FixableCheck,))
+        main.run_all_checks(fix=True)
+        assert [name for name, _ in calls] == ["run", "fix"]
+        assert calls[0][1] is calls[1][1]
 
 
 class TestNodeJSCheck:
@@ -105,6 +137,116 @@ class TestNodeJSCheck:
         assert check.min_version >= (18, 0, 0)
 
 
+class TestOpenClawCheck:
+    """Test OpenClaw CLI check."""
+    
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX exec bits")
+    def test_find_in_path_prefers_earlier_name(self, tmp_path):
+        from openclaw_doctor.checks.openclaw import _find_in_path
+        
+        first, second = tmp_path / "a", tmp_path / "b"
+        first.mkdir()
+        second.mkdir()
+        for path in (first / "oc", second / "openclaw"):
+            path.write_text("#!/bin/sh\n")
+            path.chmod(0o755)
+        (first / "claw").write_text("not executable")
+        
+        path_env = os.pathsep.join([str(first), str(second)])
+        assert _find_in_path(("openclaw", "oc", "claw"), path_env) == str(second / "openclaw")
+        assert _find_in_path(("claw", "oc"), path_env) == str(first / "oc")
+    
+    @pytest.mark.parametrize("output, version", [
+        ("1.2.3\n", "1.2.3"),
+        ("v1.2.3", "1.2.3"),
+        ("openclaw v1.2.3-beta.1", "1.2.3-beta.1"),
+        ("OpenClaw 1.2.3", "1.2.3"),
+        ("openclaw version 1.2.3", "1.2.3"),
+        ("openclaw/1.2.3 linux-x64 node-v20.11.0", "1.2.3"),
+        ("dev build", "dev build"),
+        ("", None),
+    ])
+    def test_parse_version(self, output, version):
+        from openclaw_doctor.checks.openclaw import _parse_version
+        
+        assert _parse_version(output) == version
+
+
+class TestDockerCheck:
+    """Test Docker check parsing of `docker info` JSON."""
+    
+    @pytest.fixture
+    def fake_docker(self, monkeypatch):
+        import json
+        import subprocess
+        from openclaw_doctor.checks import docker
+        
+        outputs = {}
+        
+        def fake_run(cmd, **kwargs):
+            returncode, stdout = outputs.get(tuple(cmd[1:]), (1, ""))
+            return subprocess.CompletedProcess(cmd, returncode, stdout, "")
+        
+        def set_info(info, returncode=0):
+            outputs[("info", "--format", "{{json .}}")] = (returncode, json.dumps(info))
+        
+        monkeypatch.setattr(docker, "_which", lambda name: f"/usr/bin/{name}")
+        monkeypatch.setattr(docker.subprocess, "run", fake_run)
+        monkeypatch.setattr(docker.subprocess, "call", lambda cmd, **kwargs: outputs.get(("call",), 1))
+        docker._docker_info_json.cache_clear()
+        yield outputs, set_info
+        docker._docker_info_json.cache_clear()
+    
+    def test_versions_from_info_json(self, fake_docker):
+        from openclaw_doctor.checks import DockerCheck
+        
+        _, set_info = fake_docker
+        set_info({
+            "ServerVersion": "24.0.6",
+            "ClientInfo": {
+                "Version": "24.0.7",
+                "Plugins": [{"Name": "buildx", "Version": "v0.11"}, {"Name": "compose", "Version": "v2.23.0"}],
+            },
+        })
+        result = DockerCheck().run()
+        assert result.status == CheckStatus.PASS
+        assert result.message == "Docker 24.0.7 running"
+        assert result.details == "Docker 24.0.7, Compose v2.23.0"
+    
+    def test_server_version_when_client_version_missing(self, fake_docker):
+        from openclaw_doctor.checks import DockerCheck
+        
+        _, set_info = fake_docker
+        set_info({"ServerVersion": "23.0.1", "ClientInfo": {"Plugins": []}})
+        result = DockerCheck().run()
+        assert result.message == "Docker 23.0.1 running"
+        assert result.details == "Docker 23.0.1 (Compose not found)"
+    
+    def test_daemon_down(self, fake_docker):
+        from openclaw_doctor.checks import DockerCheck
+        
+        _, set_info = fake_docker
+        set_info(
+            {"ClientInfo": {"Version": "24.0.7"}, "ServerErrors": ["Cannot connect to the Docker daemon"]},
+            returncode=1,
+        )
+        result = DockerCheck().run()
+        assert result.status == CheckStatus.WARN
+        assert result.message == "Docker 24.0.7 installed but not running"
+    
+    def test_falls_back_without_version(self, fake_docker):
+        from openclaw_doctor.checks import DockerCheck
+        
+        outputs, set_info = fake_docker
+        set_info({"ClientInfo": {}})
+        outputs[("--version",)] = (0, "Docker version 20.10.2, build 2291f61\n")
+        outputs[("compose", "version")] = (0, "Docker Compose version v2.5.0\n")
+        outputs[("call",)] = 0
+        result = DockerCheck().run()
+        assert result.status == CheckStatus.PASS
+        assert result.details == "Docker 20.10.2, Compose v2.5.0"
+
+
 class TestSystemCheck:
     """Test System requirements check."""
     
@@ -134,3 +276,214 @@ class TestNetworkCheck:
         check = NetworkCheck()
         assert len(check.ENDPOINTS) > 0
         assert "Anthropic" in check.ENDPOINTS
+
+
+class TestAPIKeysCheck:
+    """Test API keys check."""
+    
+    def test_valid_env_key(self, monkeypatch):
+        for key_name in APIKeysCheck.ENV_KEYS:
+            monkeypatch.delenv(key_name, raising=False)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-" + "a-b_c" * 8)
+        found, invalid = APIKeysCheck()._check_env_keys()
+        assert found == ["ANTHROPIC_API_KEY"]
+        assert invalid == []
+    
+    def test_invalid_env_keys(self, monkeypatch):
+        for key_name in APIKeysCheck.ENV_KEYS:
+            monkeypatch.delenv(key_name, raising=False)
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-" + "a-" * 20)
+        monkeypatch.setenv("GOOGLE_API_KEY", "AIza" + "x" * 36)
+        monkeypatch.setenv("GROQ_API_KEY", "gsk_short")
+        found, invalid = APIKeysCheck()._check_env_keys()
+        assert found == []
+        assert sorted(invalid) == ["GOOGLE_API_KEY", "GROQ_API_KEY", "OPENAI_API_KEY"]
+    
+    def test_env_file_keys(self, tmp_path, monkeypatch):
+        env_path = tmp_path / ".env"
+        env_path.write_text(
+            "# OPENAI_API_KEY=commented\n"
+            "  GROQ_API_KEY = gsk_value\r\n"
+            "OTHER_SETTING=1\n",
+            encoding="utf-8",
+        )
+        monkeypatch.setenv("OPENCLAW_HOME", str(tmp_path))
+        monkeypatch.chdir(tmp_path / "..")
+        found, path = APIKeysCheck()._check_env_file()
+        assert found == ["GROQ_API_KEY (in .env)"]
+        assert path == env_path
+
+
+class TestYAMLCache:
+    """Test the shared YAML config loader."""
+    
+    def test_reparses_after_change(self, tmp_path):
+        from openclaw_doctor.checks._yaml_cache import load_yaml
+        
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("provider: anthropic\n", encoding="utf-8")
+        assert load_yaml(config_path) == {"provider": "anthropic"}
+        assert load_yaml(config_path) is load_yaml(config_path)
+        
+        config_path.write_text("provider: openai-compatible\n", encoding="utf-8")
+        assert load_yaml(config_path) == {"provider": "openai-compatible"}
+
+
+class TestFoldersCheck:
+    """Test OpenClaw folder structure check."""
+    
+    def test_reports_missing_entries(self, tmp_path, monkeypatch):
+        from openclaw_doctor.checks import FoldersCheck
+        
+        (tmp_path / "skills").mkdir()
+        (tmp_path / "channels").write_text("not a directory", encoding="utf-8")
+        (tmp_path / "config.yml").write_text("provider: anthropic\n", encoding="utf-8")
+        monkeypatch.setenv("OPENCLAW_HOME", str(tmp_path))
+        
+        check = FoldersCheck()
+        result = check.run()
+        assert result.status == CheckStatus.WARN
+        assert check._found_dirs == ["skills"]
+        assert check._missing_dirs == ["channels", "workspaces"]
+        assert check._found_files == ["config.yml"]
+    
+    def test_home_from_environment(self, tmp_path, monkeypatch):
+        from openclaw_doctor.checks import FoldersCheck, _paths
+        
+        monkeypatch.setattr(_paths, "HOME", str(tmp_path / "missing"))
+        monkeypatch.setenv("OPENCLAW_HOME", str(tmp_path / "missing"))
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+        (tmp_path / "openclaw").mkdir()
+        assert FoldersCheck()._find_openclaw_home() == tmp_path / "openclaw"
+        
+        monkeypatch.setenv("OPENCLAW_HOME", str(tmp_path))
+        assert FoldersCheck()._find_openclaw_home() == tmp_path
+
+
+class TestHomeResolution:
+    """Test that every check finds OpenClaw files under the same home."""
+    
+    def test_checks_share_openclaw_home(self, tmp_path, monkeypatch):
+        from openclaw_doctor.checks import ConfigCheck, LogsCheck, OpenClawCheck
+        
+        (tmp_path / "logs").mkdir()
+        (tmp_path / "config.yaml").write_text("provider: anthropic\n", encoding="utf-8")
+        monkeypatch.setenv("OPENCLAW_HOME", str(tmp_path))
+        
+        assert OpenClawCheck()._get_home_directory() == tmp_path
+        assert LogsCheck()._find_log_directory() == tmp_path / "logs"
+        fd, config_path = ConfigCheck()._find_config()
+        os.close(fd)
+        assert config_path == tmp_path / "config.yaml"
+
+
+class TestLogsCheck:
+    """Test log parsing check."""
+    
+    def test_parse_log_file(self, tmp_path):
+        from openclaw_doctor.checks import LogsCheck
+        
+        log_file = tmp_path / "openclaw.log"
+        log_file.write_text(
+            "INFO starting\n"
+            "ERROR connect ECONNREFUSED 127.0.0.1:443\n"
+            "WARN Rate limit reached, retrying\n"
+            "ERROR connection refused again\n",
+            encoding="utf-8",
+        )
+        errors = LogsCheck()._parse_log_file(log_file)
+        assert [(e.message, line) for e, line in errors] == [
+            ("API rate limit exceeded", "WARN Rate limit reached, retrying"),
+            ("Connection refused", "ERROR connect ECONNREFUSED 127.0.0.1:443"),
+        ]
+    
+    def test_parse_log_file_overlapping_matches(self, tmp_path):
+        from openclaw_doctor.checks import LogsCheck
+        
+        log_file = tmp_path / "openclaw.log"
+        log_file.write_text("ERROR ETIMEDOUT of memory\n", encoding="utf-8")
+        errors = LogsCheck()._parse_log_file(log_file)
+        assert [e.message for e, _ in errors] == ["Connection timeout", "Out of memory"]
+    
+    def test_parse_log_file_with_re2(self, tmp_path, monkeypatch):
+        re2 = pytest.importorskip("re2")
+        from openclaw_doctor.checks import LogsCheck, logs
+        
+        monkeypatch.setattr(logs, "_COMBINED_RE", re2.compile(logs._COMBINED_RE.pattern))
+        log_file = tmp_path / "openclaw.log"
+        log_file.write_text(
+            "ERROR connect ECONNREFUSED 127.0.0.1:443\n"
+            "WARN Rate limit reached, retrying\n",
+            encoding="utf-8",
+        )
+        errors = LogsCheck()._parse_log_file(log_file)
+        assert [e.message for e, _ in errors] == ["API rate limit exceeded", "Connection refused"]
+    
+    def test_find_log_files(self, tmp_path):
+        from openclaw_doctor.checks import LogsCheck
+        
+        now = time.time()
+        for name, age in [("a.log", 60), ("openclaw-b.log", 0), ("notes.md", 0), ("old.txt", 3 * 86400)]:
+            path = tmp_path / name
+            path.write_text("x")
+            os.utime(path, (now - age, now - age))
+        (tmp_path / "error-dir").mkdir()
+        
+        files = LogsCheck()._find_log_files(tmp_path)
+        assert [f.name for f in files] == ["openclaw-b.log", "a.log"]
+    
+    @pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges on Windows")
+    def test_symlinked_log_file(self, tmp_path, monkeypatch):
+        from openclaw_doctor.checks import LogsCheck
+        
+        target = tmp_path / "elsewhere" / "app.log"
+        target.parent.mkdir()
+        target.write_text("ERROR connect ECONNREFUSED 127.0.0.1:443\n")
+        log_dir = tmp_path / "home" / "logs"
+        log_dir.mkdir(parents=True)
+        (log_dir / "openclaw.log").symlink_to(target)
+        (log_dir / "dangling.log").symlink_to(tmp_path / "missing.log")
+        monkeypatch.setenv("OPENCLAW_HOME", str(log_dir.parent))
+        
+        result = LogsCheck().run()
+        assert result.status == CheckStatus.FAIL
+        assert "Connection refused" in result.details
+    
+    def test_anchors_cover_every_pattern(self):
+        from openclaw_doctor.checks.logs import _ANCHORS, ERROR_PATTERNS
+        
+        for error in ERROR_PATTERNS:
+            for alternative in error.pattern.split("|"):
+                literal = alternative.replace(".?", "").lower().encode()
+                assert any(anchor in literal for anchor in _ANCHORS), alternative
+
+
+class TestJSONOutput:
+    """Test the --json command line output."""
+    
+    def _invoke(self, monkeypatch, statuses):
+        from typer.testing import CliRunner
+        from openclaw_doctor import main
+        
+        results = [
+            CheckResult(name=f"Check {i}", status=status, message=status.value)
+            for i, status in enumerate(statuses)
+        ]
+        monkeypatch.setattr(main, "run_all", lambda: results)
+        return CliRunner().invoke(main.app, ["--json"])
+    
+    def test_piped_output(self, monkeypatch):
+        import json
+        
+        result = self._invoke(monkeypatch, [CheckStatus.PASS, CheckStatus.WARN, CheckStatus.FAIL])
+        output = json.loads(result.output)
+        assert [check["name"] for check in output["checks"]] == ["Check 0", "Check 1", "Check 2"]
+        assert output["summary"] == {"passed": 1, "warnings": 1, "failed": 1}
+        assert result.exit_code == 1
+    
+    def test_exit_code_without_failures(self, monkeypatch):
+        import json
+        
+        result = self._invoke(monkeypatch, [CheckStatus.PASS, CheckStatus.WARN])
+        assert json.loads(result.output)["summary"] == {"passed": 1, "warnings": 1, "failed": 0}
+        assert result.exit_code == 0